@@ -0,0 +1,54 @@
+import os
+import pickle
+
+from job_analyzer import analysis_fingerprint
+
+# Prebuilt analytics for one dataset version, loaded by the app at boot
+SNAPSHOT_FILE = "analytics.pkl"
+
+# Bump when the snapshot layout changes so old snapshots are ignored
+SNAPSHOT_FORMAT_VERSION = 1
+
+# Token streams only feed extraction and the search index, both already built
+TRANSIENT_COLUMNS = ['title_tokens', 'description_tokens']
+
+
+def build_snapshot(analyzer):
+    """Collect a processed JobAnalyzer's results into a snapshot dict"""
+    return {
+        'format_version': SNAPSHOT_FORMAT_VERSION,
+        'fingerprint': analysis_fingerprint(),
+        'df': analyzer.df.drop(columns=[col for col in TRANSIENT_COLUMNS if col in analyzer.df.columns]),
+        'extracted_data': analyzer.extracted_data,
+        'skill_counts': analyzer.skill_counts,
+        'benefit_counts': analyzer.benefit_counts,
+        'facets': analyzer.facets,
+        'aggregates': analyzer.aggregates,
+    }
+
+
+def save_snapshot(snapshot, path=SNAPSHOT_FILE):
+    """Write the snapshot in pickle's binary format, atomically"""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, path)
+
+
+def load_snapshot(path=SNAPSHOT_FILE):
+    """Load a snapshot, or return None if it is missing, unreadable, outdated or built with other rules"""
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, 'rb') as f:
+            snapshot = pickle.load(f)
+    except Exception as e:
+        print(f"[WARNING] Could not read analytics snapshot {path}: {str(e)}")
+        return None
+    if snapshot.get('format_version') != SNAPSHOT_FORMAT_VERSION:
+        return None
+    if snapshot.get('fingerprint') != analysis_fingerprint():
+        # Keywords, patterns or tokenizer changed since the refresh; recompute from the CSV
+        print(f"[INFO] Ignoring analytics snapshot {path}: built with different extraction rules")
+        return None
+    return snapshot
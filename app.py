@@ -1,16 +1,37 @@
+import time
+
+# Measured from the top of the script so import time is included
+RUN_STARTED = time.perf_counter()
+
 import streamlit as st
 import pandas as pd
-import numpy as np
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-import re
-from collections import Counter
-from datetime import datetime, timedelta
+from datetime import datetime
+import hashlib
 import io
+import json
 import subprocess
 import sys
 import os
+from dataset_store import current_version, version_path
+from job_analyzer import JobAnalyzer, filtered_skill_counts
+from analytics_snapshot import load_snapshot, SNAPSHOT_FILE
+
+IMPORTS_FINISHED = time.perf_counter()
+
+# Dataset versions kept in memory (the current one and the one sessions may still show)
+DATASET_CACHE_ENTRIES = 2
+
+# Cache key prefix of uploaded CSVs, which have no files in the dataset store
+UPLOAD_PREFIX = "upload-"
+
+# Cached figure sets (one per dataset version, filter state and tab)
+FIGURE_CACHE_ENTRIES = 256
+
+# Search hits listed in the results table (all matches still filter the dashboard)
+SEARCH_RESULTS_LIMIT = 200
+
+# Output of the background refresh process
+REFRESH_LOG = "refresh.log"
 
 # Configure page
 st.set_page_config(
@@ -55,195 +76,152 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-class JobAnalyzer:
-    def __init__(self, df):
-        self.df = df
-        self.extracted_data = None
-        self.skill_counts = None
-        self.benefit_counts = None
-        self.process_data()
-    
-    def extract_skills_and_requirements(self, description):
-        """Extract skills, requirements, and benefits from job description"""
-        if pd.isna(description) or not description:
-            return {"skills": [], "experience": [], "degree": [], "benefits": []}
-        
-        desc_lower = description.lower()
-        
-        # Programming languages and technical skills
-        programming_skills = [
-            'python', 'java', 'javascript', 'sql', 'r', 'scala', 'c++', 'c#', 
-            'go', 'kotlin', 'swift', 'php', 'ruby', 'matlab', 'sas', 'stata'
-        ]
-        
-        # Data science and analytics tools
-        data_tools = [
-            'pandas', 'numpy', 'scikit-learn', 'tensorflow', 'pytorch', 'keras',
-            'tableau', 'power bi', 'powerbi', 'looker', 'qlik', 'spotfire',
-            'excel', 'spark', 'hadoop', 'kafka', 'airflow', 'docker', 'kubernetes',
-            'aws', 'azure', 'gcp', 'google cloud', 'bigquery', 'snowflake', 'redshift'
-        ]
-        
-        # Machine learning concepts
-        ml_concepts = [
-            'machine learning', 'deep learning', 'neural networks', 'nlp', 
-            'computer vision', 'time series', 'forecasting', 'optimization',
-            'statistics', 'statistical modeling', 'data mining', 'analytics'
-        ]
-        
-        # Experience patterns
-        experience_patterns = [
-            r'(\d+)\+?\s*years?\s*(?:of\s*)?experience',
-            r'(\d+)\s*to\s*(\d+)\s*years?\s*experience',
-            r'minimum\s*(\d+)\s*years?',
-            r'at least\s*(\d+)\s*years?'
-        ]
-        
-        # Degree patterns
-        degree_patterns = [
-            r"bachelor'?s?\s*(?:degree)?",
-            r"master'?s?\s*(?:degree)?",
-            r"phd", r"doctorate",
-            r"undergraduate", r"graduate"
-        ]
-        
-        # Benefits keywords
-        benefit_keywords = [
-            'salary', 'bonus', 'insurance', 'health', 'dental', 'vision',
-            'retirement', '401k', 'vacation', 'pto', 'remote', 'flexible',
-            'training', 'development', 'career growth', 'promotion'
-        ]
-        
-        # Extract skills
-        found_skills = []
-        for skill in programming_skills + data_tools + ml_concepts:
-            if skill in desc_lower:
-                found_skills.append(skill)
-        
-        # Extract experience
-        experience_reqs = []
-        for pattern in experience_patterns:
-            matches = re.findall(pattern, desc_lower)
-            for match in matches:
-                if isinstance(match, tuple):
-                    experience_reqs.append(f"{match[0]}-{match[1]} years")
-                else:
-                    experience_reqs.append(f"{match}+ years")
-        
-        # Extract degrees
-        degree_reqs = []
-        for pattern in degree_patterns:
-            if re.search(pattern, desc_lower):
-                degree_reqs.append(re.search(pattern, desc_lower).group())
-        
-        # Extract benefits
-        found_benefits = []
-        for benefit in benefit_keywords:
-            if benefit in desc_lower:
-                found_benefits.append(benefit)
-        
-        return {
-            "skills": found_skills,
-            "experience": experience_reqs,
-            "degree": degree_reqs,
-            "benefits": found_benefits
-        }
-    
-    def categorize_job_role(self, title):
-        """Categorize job titles into broader role types"""
-        title_lower = title.lower()
-        
-        if any(word in title_lower for word in ['data scientist', 'scientist']):
-            return 'Data Scientist'
-        elif any(word in title_lower for word in ['data engineer', 'engineer']):
-            return 'Data Engineer'
-        elif any(word in title_lower for word in ['analyst', 'analytics']):
-            return 'Data Analyst'
-        elif any(word in title_lower for word in ['manager', 'lead', 'head']):
-            return 'Management/Leadership'
-        elif any(word in title_lower for word in ['intern', 'internship']):
-            return 'Internship'
-        elif any(word in title_lower for word in ['research', 'researcher']):
-            return 'Research'
-        else:
-            return 'Other'
-    
-    def process_data(self):
-        """Process the dataframe and extract insights"""
-        # Convert date column
-        self.df['postDate'] = pd.to_datetime(self.df['postDate'])
-        
-        # Extract structured information
-        self.extracted_data = self.df['description'].apply(self.extract_skills_and_requirements)
-        
-        # Categorize jobs
-        self.df['job_category'] = self.df['title'].apply(self.categorize_job_role)
-        
-        # Extract skills and benefits
-        all_skills = []
-        all_benefits = []
-        
-        for data in self.extracted_data:
-            all_skills.extend(data['skills'])
-            all_benefits.extend(data['benefits'])
-        
-        self.skill_counts = Counter(all_skills)
-        self.benefit_counts = Counter(all_benefits)
-
-@st.cache_data
-def load_data():
-    """Load and cache the dataset"""
+@st.cache_data(max_entries=DATASET_CACHE_ENTRIES)
+def load_data(dataset_version):
+    """Load and cache one immutable dataset version (None if it has no CSV)"""
     try:
-        # Try multiple possible file names
-        possible_files = [
-            'dataset.csv',
-        ]
-        
-        for filename in possible_files:
-            try:
-                df = pd.read_csv(filename)
-                st.success(f"✅ Dataset loaded successfully: {filename}")
-                return df
-            except FileNotFoundError:
-                continue
-        
-        # If no file found, show file upload option
-        st.error("📁 Dataset file not found. Please upload your job data CSV file:")
-        uploaded_file = st.file_uploader("Choose a CSV file", type="csv")
-        if uploaded_file is not None:
-            df = pd.read_csv(uploaded_file)
-            st.success("✅ File uploaded successfully!")
-            return df
-        
+        filename = version_path(dataset_version)
+        df = pd.read_csv(filename)
+        st.success(f"✅ Dataset loaded successfully: {filename}")
+        return df
+    except FileNotFoundError:
         return None
-        
     except Exception as e:
         st.error(f"❌ Error loading dataset: {str(e)}")
         return None
 
+def load_uploaded_data():
+    """Ask for a CSV when there is no dataset; returns (df, upload id) or (None, None)"""
+    st.error("📁 Dataset file not found. Please upload your job data CSV file:")
+    uploaded_file = st.file_uploader("Choose a CSV file", type="csv")
+    if uploaded_file is None:
+        return None, None
+    try:
+        content = uploaded_file.getvalue()
+        df = pd.read_csv(io.BytesIO(content))
+    except Exception as e:
+        st.error(f"❌ Error loading dataset: {str(e)}")
+        return None, None
+    st.success("✅ File uploaded successfully!")
+    # Keyed on the content so each upload gets its own analyzer, index and figures
+    return df, f"{UPLOAD_PREFIX}{hashlib.md5(content).hexdigest()[:12]}"
+
+@st.cache_data(max_entries=DATASET_CACHE_ENTRIES)
+def load_dataset_info(dataset_version):
+    """Return (job count, latest post date) for the sidebar summary"""
+    analyzer = load_snapshot_analyzer(dataset_version)
+    if analyzer is not None:
+        return analyzer.aggregates['total_jobs'], analyzer.aggregates['latest_date']
+    
+    df_info = pd.read_csv(version_path(dataset_version), usecols=lambda col: col == 'postDate')
+    latest_date = None
+    if 'postDate' in df_info.columns:
+        try:
+            latest_date = pd.to_datetime(df_info['postDate']).max().strftime('%Y-%m-%d')
+        except:
+            pass
+    return len(df_info), latest_date
+
+@st.cache_data(max_entries=DATASET_CACHE_ENTRIES)
+def load_companies(dataset_version):
+    """Load the company dimension table of a dataset version (None for inline datasets)"""
+    from dimensions import read_dimension, COMPANIES_FILE
+    if dataset_version is None:
+        return None
+    return read_dimension(version_path(dataset_version, COMPANIES_FILE))
+
+@st.cache_resource(max_entries=DATASET_CACHE_ENTRIES)
+def load_snapshot_analyzer(dataset_version):
+    """Load the prebuilt analytics snapshot of a version (None if it has none)"""
+    if dataset_version is None:
+        return None
+    snapshot = load_snapshot(version_path(dataset_version, SNAPSHOT_FILE))
+    return JobAnalyzer.from_snapshot(snapshot) if snapshot else None
+
+@st.cache_resource(max_entries=DATASET_CACHE_ENTRIES)
+def load_analyzer(dataset_version, _df):
+    """Process a dataset version or uploaded CSV once and share the result across sessions"""
+    return JobAnalyzer(_df)
+
+@st.cache_resource(max_entries=DATASET_CACHE_ENTRIES)
+def load_search_index(dataset_version, _df):
+    """Load the search index built for this version, indexing any postings it is missing"""
+    from search_index import SearchIndex, document_keys, INDEX_FILE
+    
+    stored = dataset_version is not None and not dataset_version.startswith(UPLOAD_PREFIX)
+    index = SearchIndex.load(version_path(dataset_version, INDEX_FILE)) if stored else SearchIndex()
+    # Versions are immutable, so postings missing from the index are only added in memory
+    index.add_dataframe(_df)
+    return index, pd.Series(index.doc_ids(document_keys(_df)), index=_df.index)
+
+@st.cache_data(max_entries=FIGURE_CACHE_ENTRIES, show_spinner=False)
+def load_figure_specs(dataset_version, filter_state, tab, _filtered_df, _extracted_data):
+    """Build one tab's figures and cache their serialized specs"""
+    # Plotly is only imported once a chart actually has to be built
+    from charts import build_figure_specs
+    return build_figure_specs(tab, _filtered_df, _extracted_data)
+
+def show_figure(spec):
+    """Render a cached figure spec"""
+    # st.plotly_chart still validates the spec as a plotly Figure on every rerun;
+    # the cache saves the px.* call and the empty template keeps validation cheap
+    st.plotly_chart(json.loads(spec), use_container_width=True)
+
+@st.cache_resource
+def refresh_jobs():
+    """Background refresh process shared by every session"""
+    return {}
+
 def refresh_data():
-    """Refresh the dataset by running the scraper"""
+    """Start the scraper in the background; the dashboard keeps serving the current version"""
+    jobs = refresh_jobs()
+    process = jobs.get('process')
+    if process is not None and process.poll() is None:
+        st.info("🔄 A data refresh is already running in the background.")
+        return False
+    
     try:
-        with st.spinner("🔄 Scraping new LinkedIn job data... This may take a few minutes."):
-            # Run the refresh_data.py script
-            result = subprocess.run([sys.executable, "refresh_data.py"], 
-                                  capture_output=True, text=True, cwd=os.getcwd())
-            
-            if result.returncode == 0:
-                st.success("✅ Data refresh completed successfully!")
-                st.info("📊 New jobs have been added to your dataset. Please refresh the page to see the updated data.")
-                # Clear cache to reload data
-                st.cache_data.clear()
-                return True
-            else:
-                st.error(f"❌ Error during data refresh: {result.stderr}")
-                return False
+        # Run the refresh_data.py script
+        with open(REFRESH_LOG, 'w', encoding='utf-8') as log_file:
+            jobs['process'] = subprocess.Popen([sys.executable, "refresh_data.py"],
+                                               stdout=log_file, stderr=subprocess.STDOUT, cwd=os.getcwd())
+        st.success("✅ Data refresh started! New jobs appear automatically once the next dataset version is published.")
+        return True
                 
     except Exception as e:
         st.error(f"❌ Error running data refresh: {str(e)}")
         return False
 
+def show_refresh_status():
+    """Show the state of the background refresh in the sidebar"""
+    process = refresh_jobs().get('process')
+    if process is None:
+        return
+    if process.poll() is None:
+        st.info("🔄 Scraping new LinkedIn job data in the background... This may take a few minutes.")
+    elif process.returncode != 0:
+        with open(REFRESH_LOG, 'r', encoding='utf-8', errors='replace') as f:
+            st.error(f"❌ Error during data refresh: {f.read()[-2000:]}")
+
+@st.cache_resource
+def startup_timings():
+    """Import and render times of the first run in this process (the cold start)"""
+    return {}
+
+def log_render_timing():
+    """Record how long this run took; the first run per process is logged as the cold start"""
+    render_seconds = time.perf_counter() - RUN_STARTED
+    timings = startup_timings()
+    if not timings:
+        timings['imports'] = IMPORTS_FINISHED - RUN_STARTED
+        timings['first_render'] = render_seconds
+        print(f"[TIMING] Cold start: imports {timings['imports']:.2f}s, first render {render_seconds:.2f}s")
+    return render_seconds, timings
+
 def main():
+    # Pin one dataset version for the whole rerun
+    dataset_version = current_version()
+    
     # Header
     st.markdown('<h1 class="main-header">💼 LinkedIn Job Market Analyzer</h1>', unsafe_allow_html=True)
     st.markdown("### Data-Driven Insights for Job Seekers and Employers")
@@ -258,22 +236,18 @@ def main():
         
         if st.button("🔄 Refresh Data", type="primary", help="Scrape new jobs from LinkedIn and add to dataset"):
             refresh_data()
+        show_refresh_status()
         
         st.markdown("---")
         
         # Dataset info in sidebar
-        if os.path.exists("dataset.csv"):
+        if dataset_version is not None:
             try:
-                df_info = pd.read_csv("dataset.csv")
-                st.metric("📊 Current Jobs", len(df_info))
-                
-                if 'postDate' in df_info.columns:
-                    try:
-                        df_info['postDate'] = pd.to_datetime(df_info['postDate'])
-                        latest_date = df_info['postDate'].max().strftime('%Y-%m-%d')
-                        st.metric("📅 Latest Job", latest_date)
-                    except:
-                        pass
+                job_count, latest_date = load_dataset_info(dataset_version)
+                st.metric("📊 Current Jobs", job_count)
+                if latest_date:
+                    st.metric("📅 Latest Job", latest_date)
+                st.caption(f"Dataset version: {dataset_version}")
             except:
                 pass
     
@@ -287,50 +261,55 @@ def main():
     with col3:
         st.info("🔄 **Real-time**: All charts update automatically based on your selections")
     
-    # Load data
-    df = load_data()
-    if df is None:
-        st.stop()
+    # Load data: a prebuilt snapshot skips CSV parsing and text processing
+    data_key = dataset_version
+    analyzer = load_snapshot_analyzer(dataset_version)
+    if analyzer is None:
+        df = load_data(dataset_version) if dataset_version is not None else None
+        if df is None:
+            df, data_key = load_uploaded_data()
+            if df is None:
+                st.stop()
+        analyzer = load_analyzer(data_key, df)
+    df = analyzer.df
     
     # Display dataset info
     with st.expander("📈 Dataset Information"):
         col1, col2, col3, col4 = st.columns(4)
         with col1:
-            st.metric("Total Jobs", len(df))
+            st.metric("Total Jobs", analyzer.aggregates['total_jobs'])
         with col2:
-            st.metric("Companies", df['company'].nunique())
+            st.metric("Companies", analyzer.aggregates['companies'])
         with col3:
-            st.metric("Locations", df['location'].nunique())
+            st.metric("Locations", analyzer.aggregates['locations'])
         with col4:
-            if 'postDate' in df.columns:
-                try:
-                    df['postDate'] = pd.to_datetime(df['postDate'])
-                    date_range = (df['postDate'].max() - df['postDate'].min()).days
-                    st.metric("Date Range", f"{date_range} days")
-                except:
-                    st.metric("Date Range", "N/A")
-            else:
-                st.metric("Columns", len(df.columns))
-    
-    analyzer = JobAnalyzer(df)
+            date_range = analyzer.aggregates['date_range_days']
+            st.metric("Date Range", f"{date_range} days" if date_range is not None else "N/A")
     
     # Sidebar filters
     st.sidebar.header("🔍 Filters")
     
+    # Full-text search
+    search_query = st.sidebar.text_input(
+        "🔎 Search Jobs",
+        placeholder='e.g. dbt airflow remote',
+        help='Searches job titles and descriptions. Use "quotes" for exact phrases; accents are optional.'
+    )
+    
     # Company filter
-    companies = ['All'] + sorted(df['company'].unique().tolist())
+    companies = ['All'] + analyzer.facets['company']
     selected_company = st.sidebar.selectbox("Select Company", companies)
     
     # Location filter
-    locations = ['All'] + sorted(df['location'].unique().tolist())
+    locations = ['All'] + analyzer.facets['location']
     selected_location = st.sidebar.selectbox("Select Location", locations)
     
     # Experience level filter
-    exp_levels = ['All'] + sorted(df['experienceLevel'].unique().tolist())
+    exp_levels = ['All'] + analyzer.facets['experienceLevel']
     selected_exp = st.sidebar.selectbox("Select Experience Level", exp_levels)
     
     # Job category filter
-    job_categories = ['All'] + sorted(df['job_category'].unique().tolist())
+    job_categories = ['All'] + analyzer.facets['job_category']
     selected_category = st.sidebar.selectbox("Select Job Category", job_categories)
     
     # Apply filters
@@ -344,6 +323,20 @@ def main():
     if selected_category != 'All':
         filtered_df = filtered_df[filtered_df['job_category'] == selected_category]
     
+    # Apply search
+    if search_query.strip():
+        search_index, row_doc_ids = load_search_index(data_key, df)
+        hit_ids, hit_scores = search_index.search(search_query)
+        row_scores = row_doc_ids.loc[filtered_df.index].map(pd.Series(hit_scores, index=hit_ids))
+        filtered_df = filtered_df[row_scores.notna()]
+        
+        st.sidebar.caption(f"{len(filtered_df)} jobs match \"{search_query}\"")
+        
+        with st.expander(f"🔎 Search Results ({len(filtered_df)})"):
+            results_df = filtered_df[['title', 'company', 'location']].copy()
+            results_df['score'] = row_scores.dropna().round(2)
+            st.dataframe(results_df.nlargest(SEARCH_RESULTS_LIMIT, 'score'), use_container_width=True)
+    
     # Overview metrics
     st.markdown('<div class="section-header">📊 Market Overview</div>', unsafe_allow_html=True)
     
@@ -360,129 +353,87 @@ def main():
     # Main dashboard
     tab1, tab2, tab3, tab4, tab5 = st.tabs(["📈 Market Trends", "🛠️ Skills Analysis", "🏢 Companies & Locations", "💼 Job Categories", "📋 Recommendations"])
     
+    # Figures are cached per dataset version, filter state and tab
+    filter_state = (selected_company, selected_location, selected_exp, selected_category, search_query.strip())
+    
+    def tab_figures(tab):
+        return load_figure_specs(data_key, filter_state, tab, filtered_df, analyzer.extracted_data)
+    
     with tab1:
         st.markdown('<div class="section-header">📈 Job Market Trends</div>', unsafe_allow_html=True)
+        figures = tab_figures('market_trends')
         
         col1, col2 = st.columns(2)
         
         with col1:
             # Employment type distribution
-            emp_dist = filtered_df['employmentType'].value_counts()
-            fig_emp = px.pie(values=emp_dist.values, names=emp_dist.index, 
-                           title="Employment Type Distribution")
-            st.plotly_chart(fig_emp, use_container_width=True)
+            show_figure(figures['employment'])
         
         with col2:
             # Experience level distribution
-            exp_dist = filtered_df['experienceLevel'].value_counts()
-            fig_exp = px.bar(x=exp_dist.index, y=exp_dist.values, 
-                           title="Experience Level Distribution")
-            st.plotly_chart(fig_exp, use_container_width=True)
+            show_figure(figures['experience'])
         
         # Posting timeline
-        posting_timeline = filtered_df.groupby(filtered_df['postDate'].dt.date).size()
-        fig_timeline = px.line(x=posting_timeline.index, y=posting_timeline.values,
-                             title="Job Posting Timeline", markers=True)
-        st.plotly_chart(fig_timeline, use_container_width=True)
+        show_figure(figures['timeline'])
     
     with tab2:
         st.markdown('<div class="section-header">🛠️ Skills Analysis</div>', unsafe_allow_html=True)
+        figures = tab_figures('skills')
         
-        # Recalculate skills for filtered data
-        filtered_skills = []
-        for idx in filtered_df.index:
-            if idx < len(analyzer.extracted_data):
-                filtered_skills.extend(analyzer.extracted_data.iloc[idx]['skills'])
-        
-        if filtered_skills:
-            skill_counts_filtered = Counter(filtered_skills)
-            top_skills = skill_counts_filtered.most_common(15)
-            
+        if figures:
             col1, col2 = st.columns(2)
             
             with col1:
                 # Top skills bar chart
-                skills_df = pd.DataFrame(top_skills, columns=['Skill', 'Count'])
-                fig_skills = px.bar(skills_df, x='Count', y='Skill', orientation='h',
-                                  title="Top 15 Most Demanded Skills",
-                                  color='Count', color_continuous_scale='viridis')
-                fig_skills.update_layout(yaxis={'categoryorder':'total ascending'})
-                st.plotly_chart(fig_skills, use_container_width=True)
+                show_figure(figures['top_skills'])
             
             with col2:
                 # Skills by category
-                programming_langs = ['python', 'sql', 'r', 'java', 'javascript', 'scala', 'go']
-                viz_tools = ['tableau', 'power bi', 'excel']
-                ml_tools = ['tensorflow', 'pytorch', 'scikit-learn', 'machine learning', 'deep learning']
-                cloud_tools = ['aws', 'azure', 'gcp', 'google cloud']
-                
-                skill_categories = {
-                    'Programming': sum([skill_counts_filtered.get(skill, 0) for skill in programming_langs]),
-                    'Visualization': sum([skill_counts_filtered.get(skill, 0) for skill in viz_tools]),
-                    'ML/AI': sum([skill_counts_filtered.get(skill, 0) for skill in ml_tools]),
-                    'Cloud': sum([skill_counts_filtered.get(skill, 0) for skill in cloud_tools]),
-                    'Analytics': skill_counts_filtered.get('analytics', 0) + skill_counts_filtered.get('statistics', 0)
-                }
-                
-                fig_cat = px.bar(x=list(skill_categories.keys()), y=list(skill_categories.values()),
-                               title="Skills by Category")
-                st.plotly_chart(fig_cat, use_container_width=True)
+                show_figure(figures['skill_categories'])
         else:
             st.info("No skills data available for the selected filters.")
     
     with tab3:
         st.markdown('<div class="section-header">🏢 Companies & Locations</div>', unsafe_allow_html=True)
+        figures = tab_figures('companies_locations')
         
         col1, col2 = st.columns(2)
         
         with col1:
             # Top companies
-            top_companies = filtered_df['company'].value_counts().head(10)
-            fig_companies = px.bar(x=top_companies.values, y=top_companies.index, orientation='h',
-                                 title="Top 10 Companies by Job Postings")
-            fig_companies.update_layout(yaxis={'categoryorder':'total ascending'})
-            st.plotly_chart(fig_companies, use_container_width=True)
+            show_figure(figures['companies'])
         
         with col2:
             # Top locations
-            top_locations = filtered_df['location'].value_counts().head(10)
-            fig_locations = px.bar(x=top_locations.values, y=top_locations.index, orientation='h',
-                                 title="Top 10 Locations by Job Postings")
-            fig_locations.update_layout(yaxis={'categoryorder':'total ascending'})
-            st.plotly_chart(fig_locations, use_container_width=True)
+            show_figure(figures['locations'])
+        
+        # Company attributes are joined from the company table only when shown
+        if st.checkbox("Show company details", help="Industry, size and website of the top hiring companies"):
+            from dimensions import company_summary
+            st.dataframe(company_summary(filtered_df, load_companies(dataset_version)), use_container_width=True)
     
     with tab4:
         st.markdown('<div class="section-header">💼 Job Categories Analysis</div>', unsafe_allow_html=True)
+        figures = tab_figures('job_categories')
         
         col1, col2 = st.columns(2)
         
         with col1:
             # Job category distribution
-            job_dist = filtered_df['job_category'].value_counts()
-            fig_jobs = px.pie(values=job_dist.values, names=job_dist.index,
-                            title="Job Category Distribution")
-            st.plotly_chart(fig_jobs, use_container_width=True)
+            show_figure(figures['categories'])
         
         with col2:
             # Job titles
-            top_titles = filtered_df['title'].value_counts().head(10)
-            fig_titles = px.bar(x=top_titles.values, y=top_titles.index, orientation='h',
-                              title="Top 10 Job Titles")
-            fig_titles.update_layout(yaxis={'categoryorder':'total ascending'})
-            st.plotly_chart(fig_titles, use_container_width=True)
+            show_figure(figures['titles'])
         
         # Skills by job category
         st.subheader("Skills by Job Category")
+        job_dist = filtered_df['job_category'].value_counts()
         for category in job_dist.index:
             category_jobs = filtered_df[filtered_df['job_category'] == category]
-            category_skills = []
+            category_skill_counts = filtered_skill_counts(category_jobs, analyzer.extracted_data)
             
-            for idx in category_jobs.index:
-                if idx < len(analyzer.extracted_data):
-                    category_skills.extend(analyzer.extracted_data.iloc[idx]['skills'])
-            
-            if category_skills:
-                category_skill_counts = Counter(category_skills)
+            if category_skill_counts:
                 top_category_skills = category_skill_counts.most_common(5)
                 
                 with st.expander(f"{category} ({len(category_jobs)} jobs)"):
@@ -541,6 +492,10 @@ def main():
     st.markdown("---")
     st.markdown("**LinkedIn Job Market Analyzer** | Built with ❤️ using Streamlit")
     st.markdown(f"*Last updated: {datetime.now().strftime('%Y-%m-%d %H:%M')}*")
+    
+    render_seconds, timings = log_render_timing()
+    st.caption(f"Rendered in {render_seconds:.2f}s · cold start: imports {timings['imports']:.2f}s, "
+               f"first render {timings['first_render']:.2f}s")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
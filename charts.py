@@ -0,0 +1,133 @@
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+
+from job_analyzer import filtered_skill_counts
+
+# Most points a time series may send to the browser
+TIMELINE_MAX_POINTS = 90
+
+# Bucket sizes tried in order until the series fits the point budget
+TIMELINE_BUCKETS = [
+    ('D', 'Day', 1),
+    ('W', 'Week', 7),
+    ('M', 'Month', 30),
+    ('Q', 'Quarter', 91),
+    ('Y', 'Year', 365),
+]
+
+# Skill groups for the "Skills by Category" chart
+SKILL_CATEGORIES = {
+    'Programming': ['python', 'sql', 'r', 'java', 'javascript', 'scala', 'go'],
+    'Visualization': ['tableau', 'power bi', 'excel'],
+    'ML/AI': ['tensorflow', 'pytorch', 'scikit-learn', 'machine learning', 'deep learning'],
+    'Cloud': ['aws', 'azure', 'gcp', 'google cloud'],
+    'Analytics': ['analytics', 'statistics'],
+}
+
+
+def timeline_series(post_dates, max_points=TIMELINE_MAX_POINTS):
+    """Count postings per day, week, month... using the finest bucket that fits max_points"""
+    dates = pd.to_datetime(post_dates).dropna()
+    if dates.empty:
+        return pd.Series(dtype='int64'), 'Day'
+
+    span_days = (dates.max() - dates.min()).days + 1
+    for freq, label, days in TIMELINE_BUCKETS:
+        if span_days / days <= max_points:
+            break
+
+    buckets = dates.dt.to_period(freq).dt.start_time
+    return buckets.value_counts().sort_index(), label
+
+
+def market_trend_figures(df, extracted_data):
+    """Employment type, experience level and posting timeline charts"""
+    # Employment type distribution
+    emp_dist = df['employment_type'].value_counts()
+    fig_emp = px.pie(values=emp_dist.values, names=emp_dist.index,
+                     title="Employment Type Distribution")
+
+    # Experience level distribution
+    exp_dist = df['experienceLevel'].value_counts()
+    fig_exp = px.bar(x=exp_dist.index, y=exp_dist.values,
+                     title="Experience Level Distribution")
+
+    # Posting timeline, bucketed so long ranges stay light
+    posting_timeline, bucket = timeline_series(df['postDate'])
+    title = "Job Posting Timeline" if bucket == 'Day' else f"Job Posting Timeline (per {bucket.lower()})"
+    fig_timeline = px.line(x=posting_timeline.index, y=posting_timeline.values, title=title, markers=True)
+
+    return {'employment': fig_emp, 'experience': fig_exp, 'timeline': fig_timeline}
+
+
+def skills_figures(df, extracted_data):
+    """Top skills and skill category charts (empty if no skills were found)"""
+    skill_counts = filtered_skill_counts(df, extracted_data)
+    if not skill_counts:
+        return {}
+
+    # Top skills bar chart
+    skills_df = pd.DataFrame(skill_counts.most_common(15), columns=['Skill', 'Count'])
+    fig_skills = px.bar(skills_df, x='Count', y='Skill', orientation='h',
+                        title="Top 15 Most Demanded Skills",
+                        color='Count', color_continuous_scale='viridis')
+    fig_skills.update_layout(yaxis={'categoryorder': 'total ascending'})
+
+    # Skills by category
+    skill_categories = {
+        category: sum(skill_counts.get(skill, 0) for skill in skills)
+        for category, skills in SKILL_CATEGORIES.items()
+    }
+    fig_cat = px.bar(x=list(skill_categories.keys()), y=list(skill_categories.values()),
+                     title="Skills by Category")
+
+    return {'top_skills': fig_skills, 'skill_categories': fig_cat}
+
+
+def company_location_figures(df, extracted_data):
+    """Top companies and top locations charts"""
+    top_companies = df['company'].value_counts().head(10)
+    fig_companies = px.bar(x=top_companies.values, y=top_companies.index, orientation='h',
+                           title="Top 10 Companies by Job Postings")
+    fig_companies.update_layout(yaxis={'categoryorder': 'total ascending'})
+
+    top_locations = df['location'].value_counts().head(10)
+    fig_locations = px.bar(x=top_locations.values, y=top_locations.index, orientation='h',
+                           title="Top 10 Locations by Job Postings")
+    fig_locations.update_layout(yaxis={'categoryorder': 'total ascending'})
+
+    return {'companies': fig_companies, 'locations': fig_locations}
+
+
+def job_category_figures(df, extracted_data):
+    """Job category distribution and top job titles charts"""
+    job_dist = df['job_category'].value_counts()
+    fig_jobs = px.pie(values=job_dist.values, names=job_dist.index,
+                      title="Job Category Distribution")
+
+    top_titles = df['title'].value_counts().head(10)
+    fig_titles = px.bar(x=top_titles.values, y=top_titles.index, orientation='h',
+                        title="Top 10 Job Titles")
+    fig_titles.update_layout(yaxis={'categoryorder': 'total ascending'})
+
+    return {'categories': fig_jobs, 'titles': fig_titles}
+
+
+# Figure builders per dashboard tab
+TAB_FIGURES = {
+    'market_trends': market_trend_figures,
+    'skills': skills_figures,
+    'companies_locations': company_location_figures,
+    'job_categories': job_category_figures,
+}
+
+
+def build_figure_specs(tab, df, extracted_data):
+    """Build one tab's figures and serialize them to JSON specs"""
+    figures = TAB_FIGURES[tab](df, extracted_data)
+    for fig in figures.values():
+        # Streamlit's chart theme supplies the styling; plotly's ~7 KB default template
+        # would be re-validated on every render, and an empty one is kept as is
+        fig.update_layout(template=go.layout.Template())
+    return {name: fig.to_json() for name, fig in figures.items()}
@@ -0,0 +1,172 @@
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+# Download state kept next to dataset.csv so a restarted refresh can resume
+CHECKPOINT_FILE = "download_checkpoint.json"
+SPOOL_FILE = "download_spool.jsonl"
+
+# Items requested per page and pages fetched at the same time
+PAGE_SIZE = 250
+MAX_WORKERS = 4
+
+# Refreshes allowed to reuse one run, and how long a checkpoint stays valid, before a
+# failure that keeps repeating after the download gives up on the run
+MAX_RESUME_ATTEMPTS = 3
+CHECKPOINT_MAX_AGE_SECONDS = 24 * 3600
+
+# Attempts per page before giving up (the checkpoint survives the failure)
+MAX_RETRIES = 3
+RETRY_DELAY_SECONDS = 2
+
+
+def load_checkpoint(path=CHECKPOINT_FILE):
+    """Return the saved download checkpoint, or None if there is none"""
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"   [WARNING] Ignoring unreadable checkpoint {path}: {str(e)}")
+        return None
+
+
+def save_checkpoint(checkpoint, path=CHECKPOINT_FILE):
+    """Write the checkpoint atomically so a crash never leaves it half-written"""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(checkpoint, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+def clear_checkpoint(checkpoint_path=CHECKPOINT_FILE, spool_path=SPOOL_FILE):
+    """Remove download state once the items have been merged into the dataset"""
+    for path in (checkpoint_path, spool_path):
+        if os.path.exists(path):
+            os.remove(path)
+
+
+def start_checkpoint(run_id, path=CHECKPOINT_FILE):
+    """Record a freshly finished run so an interrupted refresh can resume it"""
+    save_checkpoint({'run_id': run_id, 'created_at': time.time(), 'resume_attempts': 0}, path)
+
+
+def claim_resumable_run(checkpoint_path=CHECKPOINT_FILE, spool_path=SPOOL_FILE):
+    """Return the run id an interrupted refresh left behind, or None if there is none or it expired"""
+    checkpoint = load_checkpoint(checkpoint_path)
+    if not checkpoint or not checkpoint.get('run_id'):
+        return None
+
+    attempts = checkpoint.get('resume_attempts', 0) + 1
+    age = time.time() - checkpoint.get('created_at', 0)
+    if attempts > MAX_RESUME_ATTEMPTS or age > CHECKPOINT_MAX_AGE_SECONDS:
+        print(f"   [EXPIRED] Giving up on run {checkpoint['run_id']} after {attempts - 1} resumed attempts")
+        clear_checkpoint(checkpoint_path, spool_path)
+        return None
+
+    checkpoint['resume_attempts'] = attempts
+    save_checkpoint(checkpoint, checkpoint_path)
+    return checkpoint['run_id']
+
+
+def read_spool(run_id, path=SPOOL_FILE):
+    """Return {offset: items} for every page of run_id already written to the spool"""
+    pages = {}
+    if not os.path.exists(path):
+        return pages
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            try:
+                page = json.loads(line)
+            except ValueError:
+                # A crash mid-write leaves a truncated last line; that page is refetched
+                continue
+            if page.get('run_id') == run_id:
+                pages[page['offset']] = page['items']
+    return pages
+
+
+def _fetch_with_retries(fetch_page, offset, limit):
+    """Fetch one page, retrying transient failures"""
+    for attempt in range(1, MAX_RETRIES + 1):
+        try:
+            return fetch_page(offset, limit)
+        except Exception as e:
+            if attempt == MAX_RETRIES:
+                raise
+            print(f"   [RETRY] Page at offset {offset} failed ({str(e)}), attempt {attempt}/{MAX_RETRIES}")
+            time.sleep(RETRY_DELAY_SECONDS * attempt)
+
+
+def _contiguous_offset(pages, page_size, total):
+    """Return the offset up to which every page has been downloaded"""
+    offset = 0
+    while offset < total and offset in pages:
+        offset += page_size
+    return min(offset, total)
+
+
+def download_items(fetch_page, run_id, page_size=PAGE_SIZE, max_workers=MAX_WORKERS,
+                   checkpoint_path=CHECKPOINT_FILE, spool_path=SPOOL_FILE):
+    """Download all items of a finished run, resuming from the spool after a restart
+
+    fetch_page(offset, limit) must return (items, total).
+    """
+    checkpoint = load_checkpoint(checkpoint_path) or {}
+    if checkpoint.get('run_id') != run_id or checkpoint.get('page_size', page_size) != page_size:
+        # Different run (or page layout): previous download state does not apply
+        if os.path.exists(spool_path):
+            os.remove(spool_path)
+        checkpoint = {'run_id': run_id, 'created_at': time.time(), 'resume_attempts': 0}
+
+    pages = read_spool(run_id, spool_path)
+    if pages:
+        print(f"   [RESUMING] Found {len(pages)} downloaded pages for run {run_id}")
+
+    with open(spool_path, 'a', encoding='utf-8') as spool:
+        def store_page(offset, items, total):
+            spool.write(json.dumps({'run_id': run_id, 'offset': offset, 'items': items}, ensure_ascii=False) + "\n")
+            spool.flush()
+            os.fsync(spool.fileno())
+            pages[offset] = items
+            checkpoint.update({
+                'page_size': page_size,
+                'total': total,
+                'next_offset': _contiguous_offset(pages, page_size, total),
+                'pages_downloaded': len(pages),
+            })
+            save_checkpoint(checkpoint, checkpoint_path)
+
+        # The first page tells us how many items the dataset holds
+        total = checkpoint.get('total')
+        if total is None or 0 not in pages:
+            items, total = _fetch_with_retries(fetch_page, 0, page_size)
+            if 0 not in pages:
+                store_page(0, items, total)
+
+        pending = [offset for offset in range(0, total, page_size) if offset not in pages]
+        if pending:
+            print(f"   [DOWNLOADING] {len(pending)} pages left ({max_workers} parallel requests)")
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(_fetch_with_retries, fetch_page, offset, page_size): offset
+                       for offset in pending}
+            try:
+                for future in as_completed(futures):
+                    offset = futures[future]
+                    items, _ = future.result()
+                    store_page(offset, items, total)
+                    downloaded = sum(len(page) for page in pages.values())
+                    print(f"   Downloaded {downloaded}/{total} jobs...")
+            except BaseException:
+                # Stop queued pages; everything stored so far is kept for the next attempt
+                for future in futures:
+                    future.cancel()
+                raise
+
+    items = []
+    for offset in sorted(pages):
+        items.extend(pages[offset])
+    return items
@@ -0,0 +1,90 @@
+import os
+import shutil
+import uuid
+from datetime import datetime
+
+# Immutable dataset versions live under data/versions/<version_id>/
+STORE_DIR = "data"
+VERSIONS_DIR = os.path.join(STORE_DIR, "versions")
+CURRENT_FILE = os.path.join(STORE_DIR, "CURRENT")
+
+# Files inside a version directory
+DATASET_FILE = "dataset.csv"
+
+# Seed dataset shipped with the repo, served until the first refresh publishes a version
+LEGACY_DATASET = "dataset.csv"
+LEGACY_PREFIX = "legacy-"
+
+# Published versions kept on disk (the current one is never removed)
+KEEP_VERSIONS = 3
+
+
+def current_version():
+    """Return the id of the published dataset version, or None if there is no data"""
+    try:
+        with open(CURRENT_FILE, 'r', encoding='utf-8') as f:
+            version = f.read().strip()
+        if version and os.path.isdir(os.path.join(VERSIONS_DIR, version)):
+            return version
+    except FileNotFoundError:
+        pass
+
+    if os.path.exists(LEGACY_DATASET):
+        return f"{LEGACY_PREFIX}{int(os.path.getmtime(LEGACY_DATASET))}"
+    return None
+
+
+def version_path(version, filename=DATASET_FILE):
+    """Return the path of a file inside a dataset version"""
+    if version.startswith(LEGACY_PREFIX):
+        return filename
+    return os.path.join(VERSIONS_DIR, version, filename)
+
+
+def create_version():
+    """Create an empty staging directory for the next version; returns (version_id, path)"""
+    # Timestamp first so versions sort chronologically; the suffix avoids collisions
+    version = f"{datetime.now().strftime('%Y-%m-%d_%H-%M-%S_%f')}_{uuid.uuid4().hex[:4]}"
+    staging_dir = os.path.join(VERSIONS_DIR, f".staging-{version}")
+    os.makedirs(staging_dir)
+    return version, staging_dir
+
+
+def publish_version(version, staging_dir):
+    """Move a fully written staging directory into place and point CURRENT at it"""
+    final_dir = os.path.join(VERSIONS_DIR, version)
+    os.replace(staging_dir, final_dir)
+
+    # Readers see either the old or the new pointer, never a partial write
+    tmp_file = f"{CURRENT_FILE}.tmp"
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        f.write(version)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_file, CURRENT_FILE)
+
+    prune_versions(keep=KEEP_VERSIONS)
+    return final_dir
+
+
+def list_versions():
+    """Return published version ids, oldest first"""
+    if not os.path.isdir(VERSIONS_DIR):
+        return []
+    return sorted(name for name in os.listdir(VERSIONS_DIR)
+                  if not name.startswith('.') and os.path.isdir(os.path.join(VERSIONS_DIR, name)))
+
+
+def prune_versions(keep=KEEP_VERSIONS):
+    """Delete old versions and abandoned staging directories, keeping the newest ones"""
+    current = current_version()
+    for version in list_versions()[:-keep]:
+        if version != current:
+            shutil.rmtree(os.path.join(VERSIONS_DIR, version), ignore_errors=True)
+
+    # Staging directories left behind by a crashed refresh
+    for name in os.listdir(VERSIONS_DIR):
+        if name.startswith('.staging-'):
+            path = os.path.join(VERSIONS_DIR, name)
+            if os.path.getmtime(path) < datetime.now().timestamp() - 24 * 3600:
+                shutil.rmtree(path, ignore_errors=True)
@@ -0,0 +1,112 @@
+import hashlib
+import os
+
+import pandas as pd
+
+from text_pipeline import normalize_text
+
+# Dimension tables stored next to the postings (fact) table of each dataset version
+COMPANIES_FILE = "companies.csv"
+PUBLISHERS_FILE = "publishers.csv"
+
+# Posting columns that describe the company or the publisher rather than the job
+COMPANY_COLUMNS = [
+    'companyLink', 'companyDetails/industry', 'companyDetails/size',
+    'companyDetails/website', 'companyDetails'
+]
+PUBLISHER_COLUMNS = ['publisher/email', 'publisher/name', 'publisher']
+
+
+def _hash_key(prefix, values):
+    """Build a short stable key from a text column"""
+    return values.map(lambda value: f"{prefix}:{hashlib.md5(normalize_text(value).strip().encode()).hexdigest()[:12]}")
+
+
+def company_keys(df):
+    """Return the short company id of every posting (hash of the company link, else of the name)"""
+    keys = pd.Series(pd.NA, index=df.index, dtype='object')
+    if 'company_id' in df.columns:
+        keys = df['company_id'].astype('object')
+
+    missing = keys.isna()
+    if 'companyLink' in df.columns:
+        links = df['companyLink'].astype('string').str.split('?').str[0].str.rstrip('/')
+        use_link = missing & links.notna() & (links != '')
+        keys[use_link] = _hash_key('link', links[use_link])
+        missing = keys.isna()
+    if 'company' in df.columns:
+        use_name = missing & df['company'].notna()
+        keys[use_name] = _hash_key('name', df.loc[use_name, 'company'])
+    return keys
+
+
+def publisher_keys(df):
+    """Return the publisher id of every posting (email, else name; NA when unknown)"""
+    keys = pd.Series(pd.NA, index=df.index, dtype='object')
+    if 'publisher_id' in df.columns:
+        keys = df['publisher_id'].astype('object')
+
+    for column, prefix in (('publisher/email', 'email'), ('publisher/name', 'name')):
+        missing = keys.isna()
+        if column in df.columns:
+            use_column = missing & df[column].notna()
+            keys[use_column] = _hash_key(prefix, df.loc[use_column, column])
+    return keys
+
+
+def _dimension(df, key_name, keys, columns):
+    """Collapse the given attribute columns to one row per key"""
+    present = [col for col in columns if col in df.columns]
+    table = df[present].copy()
+    table.insert(0, key_name, keys)
+    table = table[table[key_name].notna()]
+    return table.groupby(key_name, sort=False, as_index=False).last()
+
+
+def split_dimensions(df):
+    """Split postings into (facts, companies, publishers) tables keyed by company_id/publisher_id"""
+    company_ids = company_keys(df)
+    publisher_ids = publisher_keys(df)
+
+    companies = _dimension(df, 'company_id', company_ids, ['company'] + COMPANY_COLUMNS)
+    publishers = _dimension(df, 'publisher_id', publisher_ids, PUBLISHER_COLUMNS)
+
+    facts = df.drop(columns=[col for col in COMPANY_COLUMNS + PUBLISHER_COLUMNS if col in df.columns])
+    facts['company_id'] = company_ids
+    facts['publisher_id'] = publisher_ids
+    return facts, companies, publishers
+
+
+def upsert_dimension(existing, updates, key_name):
+    """Merge updated rows into a dimension table; newer non-empty values win"""
+    if existing is None or existing.empty:
+        return updates.reset_index(drop=True)
+    combined = pd.concat([existing, updates], ignore_index=True)
+    return combined.groupby(key_name, sort=False, as_index=False).last()
+
+
+def read_dimension(path):
+    """Read a dimension table, or None if the dataset version has none"""
+    if not os.path.exists(path):
+        return None
+    return pd.read_csv(path, encoding='utf-8')
+
+
+def company_summary(df, companies=None, top_n=10):
+    """Return the top companies of df with their attributes joined from the company table"""
+    company_ids = company_keys(df)
+    if companies is None:
+        # Older datasets keep company attributes inline on every posting
+        _, companies, _ = split_dimensions(df)
+
+    counts = company_ids.value_counts().head(top_n).rename_axis('company_id').reset_index(name='Jobs')
+    summary = counts.merge(companies, on='company_id', how='left')
+    summary = summary.rename(columns={
+        'company': 'Company',
+        'companyDetails/industry': 'Industry',
+        'companyDetails/size': 'Size',
+        'companyDetails/website': 'Website',
+        'companyLink': 'LinkedIn',
+    })
+    columns = ['Company', 'Jobs', 'Industry', 'Size', 'Website', 'LinkedIn']
+    return summary[[col for col in columns if col in summary.columns]]
@@ -0,0 +1,191 @@
+import hashlib
+import re
+from collections import Counter
+
+import pandas as pd
+
+from text_pipeline import PhraseMatcher, split_tokens, tokenize_postings, tokenizer_fingerprint
+
+# Programming languages and technical skills
+PROGRAMMING_SKILLS = [
+    'python', 'java', 'javascript', 'sql', 'r', 'scala', 'c++', 'c#', 
+    'go', 'kotlin', 'swift', 'php', 'ruby', 'matlab', 'sas', 'stata'
+]
+
+# Data science and analytics tools
+DATA_TOOLS = [
+    'pandas', 'numpy', 'scikit-learn', 'tensorflow', 'pytorch', 'keras',
+    'tableau', 'power bi', 'powerbi', 'looker', 'qlik', 'spotfire',
+    'excel', 'spark', 'hadoop', 'kafka', 'airflow', 'docker', 'kubernetes',
+    'aws', 'azure', 'gcp', 'google cloud', 'bigquery', 'snowflake', 'redshift'
+]
+
+# Machine learning concepts
+ML_CONCEPTS = [
+    'machine learning', 'deep learning', 'neural networks', 'nlp', 
+    'computer vision', 'time series', 'forecasting', 'optimization',
+    'statistics', 'statistical modeling', 'data mining', 'analytics'
+]
+
+# Experience patterns (matched against normalized, space-joined tokens)
+EXPERIENCE_PATTERNS = [
+    r'(\d+)\+?\s*years?\s*(?:of\s*)?experience',
+    r'(\d+)\s*to\s*(\d+)\s*years?\s*experience',
+    r'minimum\s*(\d+)\s*years?',
+    r'at least\s*(\d+)\s*years?'
+]
+
+# Degree patterns (apostrophes are stripped during normalization)
+DEGREE_PATTERNS = [
+    r"\bbachelors?(?: degree)?",
+    r"\bmasters?(?: degree)?",
+    r"\bphd\b", r"\bdoctorate\b",
+    r"\bundergraduate\b", r"\bgraduate\b"
+]
+
+# Benefits keywords
+BENEFIT_KEYWORDS = [
+    'salary', 'bonus', 'insurance', 'health', 'dental', 'vision',
+    'retirement', '401k', 'vacation', 'pto', 'remote', 'flexible',
+    'training', 'development', 'career growth', 'promotion'
+]
+
+# Job title keywords, checked in order
+JOB_ROLE_KEYWORDS = [
+    ('Data Scientist', ['data scientist', 'scientist']),
+    ('Data Engineer', ['data engineer', 'engineer']),
+    ('Data Analyst', ['analyst', 'analytics']),
+    ('Management/Leadership', ['manager', 'lead', 'head']),
+    ('Internship', ['intern', 'internship']),
+    ('Research', ['research', 'researcher']),
+]
+
+def filtered_skill_counts(df, extracted_data):
+    """Count extracted skills for the rows of df only (matched by index label)"""
+    skills = Counter()
+    for data in extracted_data.loc[df.index]:
+        skills.update(data['skills'])
+    return skills
+
+# Columns offered as sidebar filters
+FACET_COLUMNS = ['company', 'location', 'experienceLevel', 'job_category']
+
+def analysis_fingerprint():
+    """Hash the keyword lists, patterns and tokenizer rules that shape the analysis"""
+    rules = [
+        PROGRAMMING_SKILLS, DATA_TOOLS, ML_CONCEPTS, EXPERIENCE_PATTERNS, DEGREE_PATTERNS,
+        BENEFIT_KEYWORDS, JOB_ROLE_KEYWORDS, FACET_COLUMNS, tokenizer_fingerprint(),
+    ]
+    return hashlib.md5(repr(rules).encode()).hexdigest()
+
+class JobAnalyzer:
+    skill_matcher = PhraseMatcher(PROGRAMMING_SKILLS + DATA_TOOLS + ML_CONCEPTS)
+    benefit_matcher = PhraseMatcher(BENEFIT_KEYWORDS)
+    experience_regexes = [re.compile(pattern) for pattern in EXPERIENCE_PATTERNS]
+    degree_regexes = [re.compile(pattern) for pattern in DEGREE_PATTERNS]
+    role_matchers = [(role, PhraseMatcher(keywords)) for role, keywords in JOB_ROLE_KEYWORDS]
+    
+    def __init__(self, df):
+        self.df = df
+        self.extracted_data = None
+        self.skill_counts = None
+        self.benefit_counts = None
+        self.facets = None
+        self.aggregates = None
+        self.process_data()
+    
+    @classmethod
+    def from_snapshot(cls, snapshot):
+        """Rebuild an analyzer from a prebuilt analytics snapshot without reprocessing"""
+        analyzer = cls.__new__(cls)
+        analyzer.df = snapshot['df']
+        analyzer.extracted_data = snapshot['extracted_data']
+        analyzer.skill_counts = snapshot['skill_counts']
+        analyzer.benefit_counts = snapshot['benefit_counts']
+        analyzer.facets = snapshot['facets']
+        analyzer.aggregates = snapshot['aggregates']
+        return analyzer
+    
+    def extract_skills_and_requirements(self, description_tokens):
+        """Extract skills, requirements, and benefits from a tokenized job description"""
+        if not description_tokens:
+            return {"skills": [], "experience": [], "degree": [], "benefits": []}
+        
+        desc_text = ' '.join(split_tokens(description_tokens))
+        
+        # Extract skills
+        found_skills = self.skill_matcher.find(description_tokens)
+        
+        # Extract experience
+        experience_reqs = []
+        for regex in self.experience_regexes:
+            for match in regex.findall(desc_text):
+                if isinstance(match, tuple):
+                    experience_reqs.append(f"{match[0]}-{match[1]} years")
+                else:
+                    experience_reqs.append(f"{match}+ years")
+        
+        # Extract degrees
+        degree_reqs = []
+        for regex in self.degree_regexes:
+            match = regex.search(desc_text)
+            if match:
+                degree_reqs.append(match.group())
+        
+        # Extract benefits
+        found_benefits = self.benefit_matcher.find(description_tokens)
+        
+        return {
+            "skills": found_skills,
+            "experience": experience_reqs,
+            "degree": degree_reqs,
+            "benefits": found_benefits
+        }
+    
+    def categorize_job_role(self, title_tokens):
+        """Categorize tokenized job titles into broader role types"""
+        for role, matcher in self.role_matchers:
+            if matcher.matches(title_tokens):
+                return role
+        return 'Other'
+    
+    def process_data(self):
+        """Process the dataframe and extract insights"""
+        # Convert date column
+        self.df['postDate'] = pd.to_datetime(self.df['postDate'])
+        
+        # Normalize and tokenize every posting once for all extractors
+        tokenize_postings(self.df)
+        
+        # Extract structured information
+        self.extracted_data = self.df['description_tokens'].apply(self.extract_skills_and_requirements)
+        
+        # Categorize jobs
+        self.df['job_category'] = self.df['title_tokens'].apply(self.categorize_job_role)
+        
+        # Extract skills and benefits
+        all_skills = []
+        all_benefits = []
+        
+        for data in self.extracted_data:
+            all_skills.extend(data['skills'])
+            all_benefits.extend(data['benefits'])
+        
+        self.skill_counts = Counter(all_skills)
+        self.benefit_counts = Counter(all_benefits)
+        
+        # Sorted values for the sidebar filters
+        self.facets = {
+            column: sorted(self.df[column].dropna().unique().tolist())
+            for column in FACET_COLUMNS if column in self.df.columns
+        }
+        
+        # Headline numbers for the dataset summary
+        has_dates = self.df['postDate'].notna().any()
+        self.aggregates = {
+            'total_jobs': len(self.df),
+            'companies': self.df['company'].nunique(),
+            'locations': self.df['location'].nunique(),
+            'date_range_days': (self.df['postDate'].max() - self.df['postDate'].min()).days if has_dates else None,
+            'latest_date': self.df['postDate'].max().strftime('%Y-%m-%d') if has_dates else None,
+        }
@@ -0,0 +1,82 @@
+import subprocess
+import sys
+
+# Fix encoding issues on Windows
+if sys.platform.startswith('win'):
+    import codecs
+    sys.stdout = codecs.getwriter('utf-8')(sys.stdout.buffer, 'strict')
+    sys.stderr = codecs.getwriter('utf-8')(sys.stderr.buffer, 'strict')
+
+# Modules app.py imports at boot, and the heavy ones it defers until a chart needs them
+BOOT_IMPORTS = ['streamlit', 'pandas', 'dataset_store', 'job_analyzer', 'analytics_snapshot']
+DEFERRED_IMPORTS = ['numpy', 'plotly.express', 'charts', 'search_index']
+
+# Each measurement runs in a fresh interpreter so nothing is already imported
+IMPORT_SNIPPET = """
+import time
+started = time.perf_counter()
+import {module}
+print(time.perf_counter() - started)
+"""
+
+SNAPSHOT_SNIPPET = """
+import time
+started = time.perf_counter()
+from dataset_store import current_version, version_path
+from analytics_snapshot import load_snapshot, SNAPSHOT_FILE
+from job_analyzer import JobAnalyzer
+snapshot = load_snapshot(version_path(current_version(), SNAPSHOT_FILE))
+if snapshot is None:
+    raise SystemExit("no snapshot")
+JobAnalyzer.from_snapshot(snapshot)
+print(time.perf_counter() - started)
+"""
+
+CSV_SNIPPET = """
+import time
+started = time.perf_counter()
+import pandas as pd
+from dataset_store import current_version, version_path
+from job_analyzer import JobAnalyzer
+JobAnalyzer(pd.read_csv(version_path(current_version())))
+print(time.perf_counter() - started)
+"""
+
+
+def time_snippet(snippet):
+    """Run a snippet in a fresh interpreter and return the seconds it printed (None on failure)"""
+    result = subprocess.run([sys.executable, "-c", snippet], capture_output=True, text=True)
+    if result.returncode != 0:
+        return None
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+def print_timing(label, seconds):
+    if seconds is None:
+        print(f"   {label:<28} not available")
+    else:
+        print(f"   {label:<28} {seconds:6.3f}s")
+
+
+def main():
+    print("[TIMING] Import times at boot:")
+    total = 0.0
+    for module in BOOT_IMPORTS:
+        seconds = time_snippet(IMPORT_SNIPPET.format(module=module))
+        print_timing(module, seconds)
+        total += seconds or 0.0
+    print_timing("total (overlapping)", total)
+
+    print("\n[TIMING] Deferred imports (paid on first chart or search):")
+    for module in DEFERRED_IMPORTS:
+        print_timing(module, time_snippet(IMPORT_SNIPPET.format(module=module)))
+
+    print("\n[TIMING] Loading the current dataset version:")
+    print_timing("analytics snapshot", time_snippet(SNAPSHOT_SNIPPET))
+    print_timing("CSV + JobAnalyzer", time_snippet(CSV_SNIPPET))
+
+    print("\n[INFO] Time to first render is logged by the app as '[TIMING] Cold start: ...'")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,6 +5,12 @@ from datetime import datetime, timedelta
 import os
 import hashlib
 import sys
+from search_index import update_search_index, INDEX_FILE
+from dataset_store import current_version, version_path, create_version, publish_version, DATASET_FILE
+from dimensions import split_dimensions, upsert_dimension, read_dimension, COMPANIES_FILE, PUBLISHERS_FILE
+from job_analyzer import JobAnalyzer
+from analytics_snapshot import build_snapshot, save_snapshot, SNAPSHOT_FILE
+from dataset_download import download_items, claim_resumable_run, start_checkpoint, clear_checkpoint
 
 # Fix encoding issues on Windows
 if sys.platform.startswith('win'):
@@ -166,23 +172,33 @@ print(f"   Require Publisher Email: {run_input['requirePublisherEmail']}")
 print(f"   Include Company Details: {run_input['includeCompanyDetails']}")
 
 try:
-    # Run the Actor with the specified input
-    print("\n[RUNNING] LinkedIn scraper...")
-    run = client.actor("hjnF35SpLkssCAven").call(run_input=run_input)
+    # Resume the download of a finished run if a previous refresh was interrupted
+    run = None
+    resumable_run_id = claim_resumable_run()
+    if resumable_run_id:
+        previous_run = client.run(resumable_run_id).get()
+        if previous_run and previous_run.get('status') == 'SUCCEEDED':
+            run = previous_run
+            print(f"\n[RESUMING] Reusing completed run {run['id']} from the last interrupted refresh")
+    
+    if run is None:
+        # Run the Actor with the specified input
+        print("\n[RUNNING] LinkedIn scraper...")
+        run = client.actor("hjnF35SpLkssCAven").call(run_input=run_input)
+        start_checkpoint(run['id'])
     
     print(f"[SUCCESS] Scraping completed! Run ID: {run['id']}")
     print(f"[STATUS] Status: {run['status']}")
     
-    # Fetch results from the dataset
+    # Fetch results from the dataset in parallel pages, spooled to disk as they arrive
     print("\n[DOWNLOADING] Fetching results...")
-    items = []
-    item_count = 0
+    dataset_client = client.dataset(run["defaultDatasetId"])
+    
+    def fetch_page(offset, limit):
+        page = dataset_client.list_items(offset=offset, limit=limit)
+        return page.items, page.total
     
-    for item in client.dataset(run["defaultDatasetId"]).iterate_items():
-        items.append(item)
-        item_count += 1
-        if item_count % 10 == 0:
-            print(f"   Downloaded {item_count} jobs...")
+    items = download_items(fetch_page, run['id'])
     
     print(f"\n[COMPLETE] Successfully scraped {len(items)} job postings!")
     
@@ -191,11 +207,12 @@ try:
         new_df = pd.DataFrame(items)
         print(f"[DATA] New data collected: {len(new_df)} jobs")
         
-        # Define the main dataset filename
-        main_dataset = "dataset.csv"
+        # Readers keep using the current version while the next one is built
+        base_version = current_version()
         
         # Check if main dataset exists
-        if os.path.exists(main_dataset):
+        if base_version:
+            main_dataset = version_path(base_version)
             print(f"[LOADING] Loading existing dataset: {main_dataset}")
             existing_df = pd.read_csv(main_dataset, encoding='utf-8')
             print(f"[DATA] Existing data: {len(existing_df)} jobs")
@@ -204,19 +221,62 @@ try:
             final_df, duplicates_removed = advanced_duplicate_detection(new_df, existing_df)
             
         else:
-            print(f"[NEW] No existing dataset found. Creating new {main_dataset}")
+            print("[NEW] No existing dataset found. Creating the first dataset version")
             final_df = new_df
             duplicates_removed = 0
         
-        # Save the updated dataset
-        final_df.to_csv(main_dataset, index=False, encoding='utf-8')
-        print(f"[SAVED] Dataset updated: {main_dataset}")
+        # Deduplication leaves gaps in the index; snapshot rows must line up with a reread CSV
+        final_df = final_df.reset_index(drop=True)
+        
+        # Split company and publisher attributes into deduplicated dimension tables
+        facts_df, company_updates, publisher_updates = split_dimensions(final_df)
+        companies_df = upsert_dimension(
+            read_dimension(version_path(base_version, COMPANIES_FILE)) if base_version else None,
+            company_updates, 'company_id'
+        )
+        publishers_df = upsert_dimension(
+            read_dimension(version_path(base_version, PUBLISHERS_FILE)) if base_version else None,
+            publisher_updates, 'publisher_id'
+        )
+        print(f"[DIMENSIONS] {len(companies_df)} companies, {len(publishers_df)} publishers")
+        
+        # Build the next version in a staging directory
+        version_id, staging_dir = create_version()
+        facts_df.to_csv(os.path.join(staging_dir, DATASET_FILE), index=False, encoding='utf-8')
+        companies_df.to_csv(os.path.join(staging_dir, COMPANIES_FILE), index=False, encoding='utf-8')
+        publishers_df.to_csv(os.path.join(staging_dir, PUBLISHERS_FILE), index=False, encoding='utf-8')
+        print(f"[SAVED] Dataset version built: {version_id}")
+        
+        # Prebuild the analytics the app loads at boot (dates, categories, extraction, facets)
+        analyzer = JobAnalyzer(facts_df.copy())
+        save_snapshot(build_snapshot(analyzer), os.path.join(staging_dir, SNAPSHOT_FILE))
+        print(f"[SNAPSHOT] Analytics snapshot built: {SNAPSHOT_FILE}")
         
-        # Create backup with timestamp
+        # Add the new postings to the previous version's search index (reusing the tokens)
+        search_index, indexed_count = update_search_index(
+            analyzer.df, os.path.join(staging_dir, INDEX_FILE),
+            base_path=version_path(base_version, INDEX_FILE) if base_version else None
+        )
+        print(f"[INDEX] Search index updated: {indexed_count} new jobs indexed ({len(search_index)} total)")
+        
+        # Atomically switch readers to the new version
+        publish_version(version_id, staging_dir)
+        main_dataset = version_path(version_id)
+        print(f"[PUBLISHED] Dataset version {version_id} is now current: {main_dataset}")
+        
+        # The run is published, so the next refresh starts a new scrape
+        clear_checkpoint()
+        
+        # Create backup with timestamp (the same fact and dimension tables as the version)
         timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-        backup_filename = f"dataset_backup_{timestamp}.csv"
-        final_df.to_csv(backup_filename, index=False, encoding='utf-8')
-        print(f"[BACKUP] Backup created: {backup_filename}")
+        backups = [
+            (f"dataset_backup_{timestamp}.csv", facts_df),
+            (f"companies_backup_{timestamp}.csv", companies_df),
+            (f"publishers_backup_{timestamp}.csv", publishers_df),
+        ]
+        for backup_filename, table in backups:
+            table.to_csv(backup_filename, index=False, encoding='utf-8')
+            print(f"[BACKUP] Backup created: {backup_filename}")
         
         # Display statistics
         print(f"\n[SUMMARY] Updated Dataset Summary:")
@@ -252,6 +312,9 @@ try:
         
     else:
         print("[WARNING] No data was scraped. Check your search parameters.")
+        clear_checkpoint()
+    
+    exit_code = 0
         
 except Exception as e:
     print(f"[ERROR] Error occurred: {str(e)}")
@@ -260,5 +323,8 @@ except Exception as e:
     print("   2. Verify you have sufficient Apify credits")
     print("   3. Try reducing the scope (e.g., specific city instead of country)")
     print("   4. Check if LinkedIn has rate limits")
+    # Non-zero so the app can report the failed refresh
+    exit_code = 1
 
-print("\n[FINISHED] Script completed!")
\ No newline at end of file
+print("\n[FINISHED] Script completed!")
+sys.exit(exit_code)
\ No newline at end of file
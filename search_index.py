@@ -0,0 +1,299 @@
+import hashlib
+import math
+import os
+import pickle
+import re
+from collections import Counter
+
+import numpy as np
+import pandas as pd
+
+from text_pipeline import joined_tokens, split_tokens, token_spans, tokenize
+
+# Default location of the persisted index (next to dataset.csv)
+INDEX_FILE = "search_index.pkl"
+
+# Bump when the on-disk layout changes so stale indexes are rebuilt
+INDEX_FORMAT_VERSION = 3
+
+# BM25 ranking parameters
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# Title matches count more than matches buried in the description
+TITLE_WEIGHT = 2.0
+
+_QUERY_RE = re.compile(r'"([^"]*)"|(\S+)')
+
+
+def document_keys(df):
+    """Return the index key of every posting (jobLink, or a content hash when missing)"""
+    if 'jobLink' in df.columns:
+        keys = df['jobLink'].astype('string').str.strip()
+    else:
+        keys = pd.Series(pd.NA, index=df.index, dtype='string')
+
+    missing = keys.isna() | (keys == '')
+    if missing.any():
+        def signature(row):
+            fields = [str(row.get(col, '')).strip().lower() for col in ('company', 'title', 'location')]
+            return 'sig:' + hashlib.md5('|'.join(fields).encode()).hexdigest()
+        keys = keys.copy()
+        keys[missing] = df[missing].apply(signature, axis=1)
+
+    return keys.astype(str)
+
+
+def _token_column(df, column):
+    """Reuse token streams from the normalization stage, tokenizing only if absent"""
+    if f'{column}_tokens' in df.columns:
+        return df[f'{column}_tokens']
+    if column in df.columns:
+        return df[column].map(tokenize)
+    return [[] for _ in range(len(df))]
+
+
+def parse_query(query):
+    """Split a query into single terms and quoted phrases"""
+    terms = []
+    phrases = []
+    for phrase, word in _QUERY_RE.findall(query or ''):
+        # Query words keep their joined form, which matches 'TikTok' and 'tiktok' alike
+        tokens = joined_tokens(tokenize(phrase if phrase else word))
+        if len(tokens) > 1 and phrase:
+            phrases.append(tokens)
+        else:
+            terms.extend(tokens)
+    return terms, phrases
+
+
+class SearchIndex:
+    """Persistent inverted index over job titles and descriptions with BM25 ranking"""
+
+    def __init__(self):
+        self.doc_keys = []
+        self.key_to_id = {}
+        self.title_lengths = []
+        self.doc_lengths = []
+        # term -> (doc_ids, weighted term frequencies, position offsets, positions)
+        self.postings = {}
+        # term -> ([doc_ids], [tfs], [positions]) for documents added since the last flush
+        self._pending = {}
+        self._lengths_array = np.zeros(0, dtype=np.float32)
+
+    def __len__(self):
+        return len(self.doc_keys)
+
+    def __contains__(self, key):
+        return key in self.key_to_id
+
+    def add_document(self, key, title_tokens, description_tokens):
+        """Index one tokenized posting; returns False if the key is already indexed"""
+        if key in self.key_to_id:
+            return False
+
+        doc_id = len(self.doc_keys)
+
+        # Leave a gap between fields so phrases never span title and description;
+        # glued words are stored at every position of their parts
+        title_length = len(split_tokens(title_tokens))
+        description_length = len(split_tokens(description_tokens))
+        term_positions = {}
+        for tokens, offset in ((title_tokens, 0), (description_tokens, title_length + 1)):
+            for token, first, last in token_spans(tokens):
+                term_positions.setdefault(str(token), []).extend(range(offset + first, offset + last + 1))
+
+        title_counts = Counter(map(str, title_tokens))
+        description_counts = Counter(map(str, description_tokens))
+        for term, positions in term_positions.items():
+            tf = TITLE_WEIGHT * title_counts.get(term, 0) + description_counts.get(term, 0)
+            pending = self._pending.setdefault(term, ([], [], []))
+            pending[0].append(doc_id)
+            pending[1].append(tf)
+            pending[2].append(positions)
+
+        self.doc_keys.append(key)
+        self.key_to_id[key] = doc_id
+        self.title_lengths.append(title_length)
+        self.doc_lengths.append(TITLE_WEIGHT * title_length + description_length)
+        return True
+
+    def add_dataframe(self, df):
+        """Index every posting in df that is not indexed yet; returns the number added"""
+        keys = document_keys(df)
+        new_rows = ~keys.isin(self.key_to_id.keys())
+        titles = _token_column(df[new_rows], 'title')
+        descriptions = _token_column(df[new_rows], 'description')
+
+        added = 0
+        for key, title_tokens, description_tokens in zip(keys[new_rows], titles, descriptions):
+            if self.add_document(key, title_tokens, description_tokens):
+                added += 1
+        if added:
+            self._flush()
+        return added
+
+    def _flush(self):
+        """Merge pending postings into the compact numpy arrays"""
+        for term, (doc_ids, tfs, positions) in self._pending.items():
+            new_ids = np.asarray(doc_ids, dtype=np.int32)
+            new_tfs = np.asarray(tfs, dtype=np.float32)
+            new_positions = np.fromiter((p for plist in positions for p in plist), dtype=np.int32)
+            new_offsets = np.cumsum([len(plist) for plist in positions], dtype=np.int64)
+
+            if term in self.postings:
+                ids, tf, offsets, flat = self.postings[term]
+                # New doc ids are always larger, so concatenation keeps ids sorted
+                ids = np.concatenate([ids, new_ids])
+                tf = np.concatenate([tf, new_tfs])
+                offsets = np.concatenate([offsets, offsets[-1] + new_offsets])
+                flat = np.concatenate([flat, new_positions])
+            else:
+                ids, tf = new_ids, new_tfs
+                offsets = np.concatenate([np.zeros(1, dtype=np.int64), new_offsets])
+                flat = new_positions
+            self.postings[term] = (ids, tf, offsets, flat)
+
+        self._pending = {}
+        self._lengths_array = np.asarray(self.doc_lengths, dtype=np.float32)
+
+    def _term_keys(self, term, doc_ids=None):
+        """Return the sorted (doc_id << 32 | position) keys of a term, limited to doc_ids when they are few"""
+        ids, _, offsets, flat = self.postings[term]
+        if doc_ids is None or len(doc_ids) * 2 > len(ids):
+            # Gathering most documents costs more than probing the extra positions later
+            doc_ids, counts, positions = ids, np.diff(offsets), flat
+        else:
+            # Gather only the position runs of the given documents
+            rows = np.searchsorted(ids, doc_ids)
+            starts = offsets[rows]
+            counts = offsets[rows + 1] - starts
+            positions = flat[np.repeat(starts - (np.cumsum(counts) - counts), counts) + np.arange(counts.sum())]
+        return (np.repeat(doc_ids.astype(np.int64), counts) << 32) | positions
+
+    def _phrase_matches(self, phrase):
+        """Return the ids of documents containing the exact token sequence"""
+        if any(term not in self.postings for term in phrase):
+            return np.zeros(0, dtype=np.int32)
+
+        # Narrow to documents holding every term, rarest first, before touching positions
+        candidates = None
+        for term in sorted(set(phrase), key=lambda term: len(self.postings[term][0])):
+            ids = self.postings[term][0]
+            candidates = ids if candidates is None else np.intersect1d(candidates, ids, assume_unique=True)
+            if not len(candidates):
+                return np.zeros(0, dtype=np.int32)
+
+        # Expand the term with the fewest positions in the candidates into phrase start keys,
+        # then binary-search each other term's sorted keys at its offset in the phrase
+        anchor = min(range(len(phrase)), key=lambda i: self.postings[phrase[i]][2][-1])
+        keys = self._term_keys(phrase[anchor], candidates)
+        starts = keys[(keys & 0xFFFFFFFF) >= anchor] - anchor if anchor else keys
+        for i, term in enumerate(phrase):
+            if i == anchor or not len(starts):
+                continue
+            term_keys = self._term_keys(term)
+            probes = starts + i
+            found = np.minimum(np.searchsorted(term_keys, probes), len(term_keys) - 1)
+            starts = starts[term_keys[found] == probes]
+
+        # Starts are sorted, so each document's matches are adjacent
+        doc_ids = (starts >> 32).astype(np.int32)
+        if len(doc_ids):
+            doc_ids = doc_ids[np.concatenate(([True], doc_ids[1:] != doc_ids[:-1]))]
+        return doc_ids
+
+    def search(self, query, limit=None):
+        """Return (doc_ids, scores) arrays ranked by BM25; quoted phrases must match exactly"""
+        if self._pending:
+            self._flush()
+
+        terms, phrases = parse_query(query)
+        n_docs = len(self.doc_keys)
+        if n_docs == 0 or (not terms and not phrases):
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.float32)
+
+        lengths = self._lengths_array
+        avg_length = float(lengths.mean()) or 1.0
+        scores = np.zeros(n_docs, dtype=np.float32)
+
+        query_terms = set(terms)
+        for phrase in phrases:
+            query_terms.update(phrase)
+
+        for term in query_terms:
+            if term not in self.postings:
+                continue
+            ids, tf, _, _ = self.postings[term]
+            idf = math.log(1 + (n_docs - len(ids) + 0.5) / (len(ids) + 0.5))
+            norm = BM25_K1 * (1 - BM25_B + BM25_B * lengths[ids] / avg_length)
+            scores[ids] += idf * tf * (BM25_K1 + 1) / (tf + norm)
+
+        if phrases:
+            allowed = None
+            for phrase in phrases:
+                matches = self._phrase_matches(phrase)
+                allowed = matches if allowed is None else np.intersect1d(allowed, matches, assume_unique=True)
+            hits = allowed[scores[allowed] > 0]
+        else:
+            hits = np.flatnonzero(scores > 0)
+
+        if limit is not None and len(hits) > limit:
+            hits = hits[np.argpartition(-scores[hits], limit - 1)[:limit]]
+        hits = hits[np.argsort(-scores[hits], kind='stable')]
+        return hits, scores[hits]
+
+    def doc_ids(self, keys):
+        """Map posting keys to index doc ids (-1 for keys that are not indexed)"""
+        return np.fromiter((self.key_to_id.get(key, -1) for key in keys), dtype=np.int64, count=len(keys))
+
+    def save(self, path=INDEX_FILE):
+        """Write the index to disk atomically"""
+        if self._pending:
+            self._flush()
+        state = {
+            'format_version': INDEX_FORMAT_VERSION,
+            'doc_keys': self.doc_keys,
+            'title_lengths': self.title_lengths,
+            'doc_lengths': self.doc_lengths,
+            'postings': self.postings,
+        }
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path=INDEX_FILE):
+        """Load an index from disk, or return an empty one if missing or outdated"""
+        index = cls()
+        if not os.path.exists(path):
+            return index
+        try:
+            with open(path, 'rb') as f:
+                state = pickle.load(f)
+        except Exception as e:
+            print(f"[WARNING] Could not read search index {path}: {str(e)}")
+            return index
+        if state.get('format_version') != INDEX_FORMAT_VERSION:
+            return index
+
+        index.doc_keys = state['doc_keys']
+        index.key_to_id = {key: i for i, key in enumerate(index.doc_keys)}
+        index.title_lengths = state['title_lengths']
+        index.doc_lengths = state['doc_lengths']
+        index.postings = state['postings']
+        index._lengths_array = np.asarray(index.doc_lengths, dtype=np.float32)
+        return index
+
+
+def update_search_index(df, path=INDEX_FILE, base_path=None):
+    """Add any new postings in df to the index at base_path (default: path) and save it to path
+
+    Returns (index, added).
+    """
+    index = SearchIndex.load(base_path or path)
+    added = index.add_dataframe(df)
+    if added or base_path or not os.path.exists(path):
+        index.save(path)
+    return index, added
@@ -0,0 +1,50 @@
+import pandas as pd
+
+from analytics_snapshot import build_snapshot, load_snapshot, save_snapshot
+from job_analyzer import JobAnalyzer, filtered_skill_counts
+
+DESCRIPTIONS = [
+    "Strong SQL and Python skills. 3+ years of experience",
+    "Build dashboards in Power BI and Excel",
+    "Machine learning with PyTorch, Python and statistics",
+    "SQL, Tableau and stakeholder reporting",
+]
+
+
+def deduplicated_postings():
+    """Postings whose index has gaps, as left by drop_duplicates during a refresh"""
+    rows = []
+    for i in range(12):
+        rows.append({
+            'jobLink': f"https://example.com/jobs/{i % 8}",
+            'title': 'Data Analyst' if i % 2 else 'Data Scientist',
+            'company': 'Acme' if i % 3 else 'Globex',
+            'location': 'Hanoi',
+            'experienceLevel': 'Entry level',
+            'postDate': f"2024-01-{i + 1:02d}",
+            'description': DESCRIPTIONS[i % len(DESCRIPTIONS)] + f" (posting {i})",
+        })
+    df = pd.DataFrame(rows).drop_duplicates(subset=['jobLink'], keep='last')
+    assert not df.index.equals(pd.RangeIndex(len(df)))
+    return df
+
+
+def test_snapshot_and_csv_paths_count_the_same_skills(tmp_path):
+    df = deduplicated_postings()
+
+    snapshot_path = tmp_path / "analytics.pkl"
+    save_snapshot(build_snapshot(JobAnalyzer(df.copy())), snapshot_path)
+    from_snapshot = JobAnalyzer.from_snapshot(load_snapshot(snapshot_path))
+
+    csv_path = tmp_path / "dataset.csv"
+    df.to_csv(csv_path, index=False)
+    from_csv = JobAnalyzer(pd.read_csv(csv_path))
+
+    for analyzer in (from_snapshot, from_csv):
+        assert filtered_skill_counts(analyzer.df, analyzer.extracted_data) == analyzer.skill_counts
+
+    snapshot_acme = from_snapshot.df[from_snapshot.df['company'] == 'Acme']
+    csv_acme = from_csv.df[from_csv.df['company'] == 'Acme']
+    assert (filtered_skill_counts(snapshot_acme, from_snapshot.extracted_data)
+            == filtered_skill_counts(csv_acme, from_csv.extracted_data))
+    assert from_snapshot.skill_counts == from_csv.skill_counts
@@ -0,0 +1,66 @@
+import pytest
+
+import dataset_download
+
+
+class FakeDataset:
+    """Local paginated dataset that fails at one offset a set number of times"""
+
+    def __init__(self, total, fail_offset=None, failures=0):
+        self.items = [{'jobLink': f'https://example.com/jobs/{i}'} for i in range(total)]
+        self.fail_offset = fail_offset
+        self.failures = failures
+        self.calls = []
+
+    def fetch_page(self, offset, limit):
+        self.calls.append(offset)
+        if offset == self.fail_offset and self.failures > 0:
+            self.failures -= 1
+            raise IOError("network blip")
+        return self.items[offset:offset + limit], len(self.items)
+
+
+@pytest.fixture
+def paths(tmp_path, monkeypatch):
+    monkeypatch.setattr(dataset_download, 'RETRY_DELAY_SECONDS', 0)
+    return {
+        'checkpoint_path': str(tmp_path / "checkpoint.json"),
+        'spool_path': str(tmp_path / "spool.jsonl"),
+    }
+
+
+def test_resume_only_fetches_missing_pages(paths):
+    dataset = FakeDataset(1003, fail_offset=500, failures=dataset_download.MAX_RETRIES)
+    with pytest.raises(IOError):
+        dataset_download.download_items(dataset.fetch_page, 'run-1', page_size=100, max_workers=1, **paths)
+
+    stored = set(dataset_download.read_spool('run-1', paths['spool_path']))
+    assert stored and 500 not in stored
+
+    dataset.calls = []
+    items = dataset_download.download_items(dataset.fetch_page, 'run-1', page_size=100, max_workers=4, **paths)
+
+    assert items == dataset.items
+    assert sorted(dataset.calls) == sorted(set(range(0, 1003, 100)) - stored)
+    checkpoint = dataset_download.load_checkpoint(paths['checkpoint_path'])
+    assert checkpoint['next_offset'] == 1003
+
+
+def test_new_run_discards_old_spool(paths):
+    dataset_download.download_items(FakeDataset(250).fetch_page, 'run-1', page_size=100, **paths)
+
+    dataset = FakeDataset(120)
+    items = dataset_download.download_items(dataset.fetch_page, 'run-2', page_size=100, **paths)
+
+    assert items == dataset.items
+    assert sorted(dataset.calls) == [0, 100]
+
+
+def test_checkpoint_expires_after_repeated_resumes(paths):
+    dataset_download.start_checkpoint('run-1', paths['checkpoint_path'])
+
+    for _ in range(dataset_download.MAX_RESUME_ATTEMPTS):
+        assert dataset_download.claim_resumable_run(**paths) == 'run-1'
+
+    assert dataset_download.claim_resumable_run(**paths) is None
+    assert dataset_download.load_checkpoint(paths['checkpoint_path']) is None
@@ -0,0 +1,94 @@
+import pandas as pd
+
+from search_index import SearchIndex, parse_query, update_search_index
+
+POSTINGS = pd.DataFrame([
+    {'jobLink': 'https://example.com/jobs/1', 'title': 'Data Analyst',
+     'description': 'SQL and Python reporting for the sales team'},
+    {'jobLink': 'https://example.com/jobs/2', 'title': 'Senior Data Scientist',
+     'description': 'Python, machine learning and analyst support'},
+    {'jobLink': 'https://example.com/jobs/3', 'title': 'Thực tập sinh Phân tích dữ liệu',
+     'description': 'Thành thạo SQL, Excel. Làm việc tại Hà Nội'},
+    {'jobLink': 'https://example.com/jobs/4', 'title': 'Marketing Lead',
+     'description': 'Grow our TikTok Shop channel; analyst of campaign data'},
+    {'jobLink': 'https://example.com/jobs/5', 'title': 'Python Developer',
+     'description': 'Python services, Python tooling and Python APIs'},
+])
+
+
+def build_index(df=POSTINGS):
+    index = SearchIndex()
+    index.add_dataframe(df)
+    return index
+
+
+def result_keys(index, query):
+    doc_ids, _ = index.search(query)
+    return [index.doc_keys[doc_id].rsplit('/', 1)[-1] for doc_id in doc_ids]
+
+
+def test_bm25_ranks_frequent_then_shorter_matches_first():
+    index = build_index()
+    # Posting 5 repeats the term; 1 and 2 mention it once but 1 is shorter
+    assert result_keys(index, 'python') == ['5', '1', '2']
+    doc_ids, scores = index.search('python')
+    assert list(scores) == sorted(scores, reverse=True)
+
+
+def test_titles_weigh_more_than_descriptions():
+    index = build_index()
+    assert result_keys(index, 'analyst')[0] == '1'
+
+
+def test_phrases_match_exact_token_sequences_only():
+    index = build_index()
+    assert result_keys(index, '"machine learning"') == ['2']
+    assert result_keys(index, '"learning machine"') == []
+    assert sorted(result_keys(index, '"data analyst"')) == ['1']
+
+
+def test_phrases_do_not_span_title_and_description():
+    index = build_index()
+    # Posting 1 has title "... Analyst" followed by description "SQL ..."
+    assert result_keys(index, '"analyst sql"') == []
+
+
+def test_matching_ignores_accents_and_case():
+    index = build_index()
+    assert result_keys(index, 'thuc tap') == ['3']
+    assert result_keys(index, '"Hà Nội"') == result_keys(index, '"ha noi"') == ['3']
+    assert result_keys(index, 'DATA ANALYST')[:1] == ['1']
+
+
+def test_glued_words_match_lowercase_queries():
+    index = build_index()
+    for query in ('tiktok', 'TikTok', '"tiktok shop"', '"tik tok shop"', '"our tiktok"'):
+        assert result_keys(index, query) == ['4'], query
+
+
+def test_parse_query_separates_terms_and_phrases():
+    assert parse_query('python "machine learning" sql') == (['python', 'sql'], [['machine', 'learning']])
+
+
+def test_incremental_build_matches_single_build(tmp_path):
+    single = build_index()
+
+    first_path = tmp_path / "first.pkl"
+    update_search_index(POSTINGS.iloc[:2], first_path)
+    incremental, added = update_search_index(POSTINGS, tmp_path / "second.pkl", base_path=first_path)
+    assert added == len(POSTINGS) - 2
+
+    reloaded = SearchIndex.load(tmp_path / "second.pkl")
+    for index in (incremental, reloaded):
+        assert index.doc_keys == single.doc_keys
+        for query in ('python', 'analyst sql', '"data analyst"', 'tiktok', 'thuc tap'):
+            expected_ids, expected_scores = single.search(query)
+            doc_ids, scores = index.search(query)
+            assert list(doc_ids) == list(expected_ids)
+            assert list(scores) == list(expected_scores)
+
+
+def test_already_indexed_postings_are_skipped():
+    index = build_index()
+    assert index.add_dataframe(POSTINGS) == 0
+    assert len(index) == len(POSTINGS)
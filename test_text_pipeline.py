@@ -0,0 +1,63 @@
+import pickle
+
+import pytest
+
+from text_pipeline import (PhraseMatcher, joined_tokens, normalize_employment_type,
+                           normalize_text, split_tokens, tokenize)
+
+
+@pytest.mark.parametrize('text, expected', [
+    ("Thực tập sinh", ['thuc', 'tap', 'sinh']),
+    ("Toàn thời gian", ['toan', 'thoi', 'gian']),
+    ("Đà Nẵng", ['da', 'nang']),
+    ("Hồ Chí Minh", ['ho', 'chi', 'minh']),
+])
+def test_vietnamese_accents_are_folded(text, expected):
+    assert tokenize(text) == expected
+    assert tokenize(text) == tokenize(normalize_text(text))
+
+
+def test_employment_types_map_across_languages():
+    assert normalize_employment_type("Toàn thời gian") == 'Full-time'
+    assert normalize_employment_type("Full-time") == 'Full-time'
+    assert normalize_employment_type("Thực tập") == 'Internship'
+
+
+def test_suffixes_and_apostrophes_are_kept_in_tokens():
+    assert tokenize("C++, C# and 5+ years; bachelor's degree") == [
+        'c++', 'c#', 'and', '5+', 'years', 'bachelors', 'degree']
+
+
+@pytest.mark.parametrize('text, parts, joined', [
+    ("PythonGood", ['python', 'good'], 'pythongood'),
+    ("SQLGood", ['sql', 'good'], 'sqlgood'),
+    ("TikTok", ['tik', 'tok'], 'tiktok'),
+    ("McKinsey", ['mc', 'kinsey'], 'mckinsey'),
+    ("PwC", ['pw', 'c'], 'pwc'),
+    ("ClickHouse", ['click', 'house'], 'clickhouse'),
+])
+def test_glued_words_keep_both_forms(text, parts, joined):
+    tokens = tokenize(text)
+    assert split_tokens(tokens) == parts
+    assert joined_tokens(tokens) == [joined]
+
+
+def test_case_does_not_change_the_joined_form():
+    for text in ("TikTok", "tiktok", "TIKTOK"):
+        assert joined_tokens(tokenize(text)) == ['tiktok']
+
+
+def test_known_mixed_case_names_are_not_split():
+    assert tokenize("JavaScript, PyTorch and PhDs") == ['javascript', 'pytorch', 'and', 'phds']
+
+
+def test_glued_words_survive_pickling():
+    tokens = pickle.loads(pickle.dumps(tokenize("TikTok Shop")))
+    assert joined_tokens(tokens) == ['tiktok', 'shop']
+
+
+def test_phrase_matcher_finds_both_forms_of_glued_words():
+    matcher = PhraseMatcher(['machine learning', 'python', 'tiktok shop', 'tik tok', 'java'])
+    tokens = tokenize("Data platformsMachine learning with PythonGood skills for TikTok Shop")
+    assert matcher.find(tokens) == ['machine learning', 'python', 'tiktok shop', 'tik tok']
+    assert matcher.find(tokenize("JavaScript")) == []
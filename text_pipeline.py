@@ -0,0 +1,182 @@
+import hashlib
+import re
+import unicodedata
+
+import pandas as pd
+
+_TOKEN_RE = re.compile(r"[^\W_]+[+#]*")
+_COMBINING_RE = re.compile(r"[\u0300-\u036f]")
+_APOSTROPHE_RE = re.compile(r"['’]")
+
+# Words glued together when bullet lists are flattened ('PythonGood', 'SQLGood')
+_MIXED_CASE_RE = re.compile(r"[A-Za-z]*(?:[a-z][A-Z]|[A-Z]{2}[a-z])[A-Za-z]*")
+_CASE_BOUNDARY_RE = re.compile(r"(?<=[a-z])(?=[A-Z])|(?<=[A-Z])(?=[A-Z][a-z]{2})")
+
+# Marks a split case boundary until tokens are read; not a word character, so it separates tokens
+_GLUE_MARK = '\x1f'
+_GLUED_TOKEN_RE = re.compile(r"[^\W_]+[+#]*(?:\x1f[^\W_]+[+#]*)*")
+
+# Mixed-case names that are one word and must not be split at their case changes
+CAMEL_CASE_TERMS = {
+    'javascript', 'typescript', 'pytorch', 'tensorflow', 'numpy', 'scipy', 'pyspark',
+    'bigquery', 'nosql', 'mysql', 'postgresql', 'mongodb', 'dynamodb', 'mlflow', 'matlab',
+    'mlops', 'devops', 'dataops', 'finops', 'sagemaker', 'langchain', 'chatgpt', 'openai',
+    'github', 'gitlab', 'linkedin', 'youtube', 'powerpoint', 'sharepoint', 'fintech',
+    'saas', 'paas', 'iaas', 'ecommerce', 'ios', 'macos', 'phd',
+}
+
+# Accent-folded employment types (LinkedIn serves Vietnamese labels for vn.linkedin.com)
+EMPLOYMENT_TYPE_LABELS = {
+    'toan thoi gian': 'Full-time',
+    'full time': 'Full-time',
+    'ban thoi gian': 'Part-time',
+    'part time': 'Part-time',
+    'hop dong': 'Contract',
+    'contract': 'Contract',
+    'thuc tap': 'Internship',
+    'internship': 'Internship',
+    'tam thoi': 'Temporary',
+    'temporary': 'Temporary',
+    'tinh nguyen': 'Volunteer',
+    'volunteer': 'Volunteer',
+}
+
+
+def normalize_text(text):
+    """Lowercase, Unicode-normalize and accent-fold text ('Thực tập' -> 'thuc tap')"""
+    text = _APOSTROPHE_RE.sub('', str(text).casefold())
+    if text.isascii():
+        return text
+    text = _COMBINING_RE.sub('', unicodedata.normalize('NFKD', text))
+    return text.replace('đ', 'd')
+
+
+def _split_glued_word(match):
+    """Split 'skillsGood' -> 'skills Good' unless the word is a known mixed-case name"""
+    word = match.group()
+    folded = word.casefold()
+    if folded in CAMEL_CASE_TERMS or folded[:-1] in CAMEL_CASE_TERMS:
+        return word
+    return _CASE_BOUNDARY_RE.sub(_GLUE_MARK, word)
+
+
+class GluedWord(str):
+    """Unsplit form of a word split at case changes ('TikTok' -> 'tik', 'tok', 'tiktok')
+
+    It follows its parts in the token stream and spans their positions, so text written
+    'TikTok' matches the query 'tiktok' as well as 'tik tok'.
+    """
+
+    def __new__(cls, value, parts):
+        word = super().__new__(cls, value)
+        word.parts = parts
+        return word
+
+    def __getnewargs__(self):
+        return str(self), self.parts
+
+
+def tokenize(text):
+    """Split text into normalized tokens, keeping suffixes like 'c++', 'c#' and '5+'"""
+    if text is None or (not isinstance(text, str) and pd.isna(text)):
+        return []
+    text = normalize_text(_MIXED_CASE_RE.sub(_split_glued_word, str(text)))
+    if _GLUE_MARK not in text:
+        return _TOKEN_RE.findall(text)
+
+    tokens = []
+    for chunk in _GLUED_TOKEN_RE.findall(text):
+        parts = chunk.split(_GLUE_MARK)
+        tokens.extend(parts)
+        if len(parts) > 1:
+            tokens.append(GluedWord(''.join(parts), len(parts)))
+    return tokens
+
+
+def token_spans(tokens):
+    """Yield (token, first_position, last_position); a GluedWord spans the positions of its parts"""
+    position = -1
+    for token in tokens:
+        if isinstance(token, GluedWord):
+            yield token, position - token.parts + 1, position
+        else:
+            position += 1
+            yield token, position, position
+
+
+def split_tokens(tokens):
+    """Return the token stream without the unsplit forms of glued words"""
+    return [token for token in tokens if not isinstance(token, GluedWord)]
+
+
+def joined_tokens(tokens):
+    """Return the token stream with each glued word in place of its parts (for queries and keywords)"""
+    joined = []
+    for token in tokens:
+        if isinstance(token, GluedWord):
+            del joined[-token.parts:]
+        joined.append(token)
+    return joined
+
+
+def tokenizer_fingerprint():
+    """Hash the normalization and tokenization rules so outputs built with other rules can be detected"""
+    rules = [
+        _TOKEN_RE.pattern, _COMBINING_RE.pattern, _APOSTROPHE_RE.pattern,
+        _MIXED_CASE_RE.pattern, _CASE_BOUNDARY_RE.pattern, _GLUED_TOKEN_RE.pattern,
+        sorted(CAMEL_CASE_TERMS), sorted(EMPLOYMENT_TYPE_LABELS.items()),
+    ]
+    return hashlib.md5(repr(rules).encode()).hexdigest()
+
+
+def normalize_employment_type(value):
+    """Map an employment type in any supported language to one English label"""
+    tokens = tokenize(value)
+    if not tokens:
+        return value
+    return EMPLOYMENT_TYPE_LABELS.get(' '.join(split_tokens(tokens)), value)
+
+
+def tokenize_postings(df):
+    """Run the normalization stage once, storing token streams for every extractor"""
+    if 'title' in df.columns:
+        df['title_tokens'] = df['title'].map(tokenize)
+    if 'description' in df.columns:
+        df['description_tokens'] = df['description'].map(tokenize)
+    if 'employmentType' in df.columns:
+        df['employment_type'] = df['employmentType'].map(normalize_employment_type)
+    return df
+
+
+class PhraseMatcher:
+    """Find keywords in a token stream, matching whole tokens instead of substrings"""
+
+    def __init__(self, keywords):
+        self.keywords = list(keywords)
+        self._phrases = [tuple(joined_tokens(tokenize(keyword))) for keyword in self.keywords]
+        self._lengths = sorted({len(phrase) for phrase in self._phrases if phrase})
+
+    def find(self, tokens):
+        """Return the keywords present in tokens, in keyword-list order"""
+        split = split_tokens(tokens)
+        ngrams = set()
+        for n in self._lengths:
+            ngrams.update(zip(*(split[i:] for i in range(n))))
+
+        # A glued word also completes phrases in place of its parts ('tiktok shop')
+        if len(split) < len(tokens):
+            for token, first, last in token_spans(tokens):
+                if not isinstance(token, GluedWord):
+                    continue
+                for n in self._lengths:
+                    for before in range(n):
+                        after = n - 1 - before
+                        if before <= first and last + after < len(split):
+                            ngrams.add(tuple(split[first - before:first]) + (token,)
+                                       + tuple(split[last + 1:last + 1 + after]))
+        return [keyword for keyword, phrase in zip(self.keywords, self._phrases)
+                if phrase and phrase in ngrams]
+
+    def matches(self, tokens):
+        """Return True if any keyword is present in tokens"""
+        return bool(self.find(tokens))